@@ -3,21 +3,179 @@
 File Audit Logger
 ==================
 
-Creates an audit log of file changes using MD5 hashing.
+Creates an audit log of file changes using content hashing (BLAKE3 when
+available, falling back to xxHash and then MD5).
 Tracks all file modifications in the repository for future agents.
 Automatically generates documentation for changed files.
 
-Output format: datetime / file path / md5 hash
+Output format: datetime / file path / content hash
 """
 
+import ast
+import fnmatch
+import itertools
 import hashlib
+import mmap
 import os
+import re
+import sys
+import warnings
 import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Tuple, Optional, List
+from string import Template
+from typing import Dict, Set, Tuple, Optional, List, Union
 import argparse
 
+# Optional fast hashers - change detection doesn't need a cryptographic hash
+try:
+    import blake3
+except ImportError:  # pragma: no cover
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+# Optional faster JSON for the state file
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if blake3 is not None:
+    HASH_ALGO = "blake3"
+elif xxhash is not None:
+    HASH_ALGO = "xxh3_128"
+else:
+    HASH_ALGO = "md5"
+
+# Read size for hashing, and the file size above which files are mmapped instead
+HASH_CHUNK_SIZE = 1 << 20
+MMAP_THRESHOLD = 8 << 20
+HAS_FILE_DIGEST = sys.version_info >= (3, 11)
+
+# Files handed to each hashing worker per task
+HASH_BATCH_SIZE = 64
+
+# Whether files can be opened relative to a directory descriptor (openat)
+SUPPORTS_DIR_FD = os.open in os.supports_dir_fd
+
+# First line of line-delimited (.tsv) state files, followed by the hash algorithm
+TSV_STATE_HEADER = "# file-audit-state hash_algo="
+
+# First line of generated READMEs, recording the hash of the documented file
+AUDIT_HASH_MARKER = "<!-- audit-hash: {} -->\n"
+
+# README templates used by DocumentationGenerator.generate_readme_content
+_README_HEADER_TEMPLATE = Template("""# $file_name
+
+**File Type:** $file_type_upper  
+**Path:** `$relative_path`  
+**Last Updated:** $timestamp  
+**Change Type:** $change_type
+
+## Overview
+
+$description
+
+## Purpose
+
+$purpose
+
+""")
+
+_README_FUNCTIONS_TEMPLATE = Template("""## Functions
+
+$functions
+
+""")
+
+_README_CLASSES_TEMPLATE = Template("""## Classes
+
+$classes
+
+""")
+
+_README_IMPORTS_TEMPLATE = Template("""## Key Imports
+
+```python
+$imports
+```
+
+""")
+
+_README_SHELL_TEMPLATE = Template("""## Usage
+
+```bash
+# Make executable
+chmod +x $file_name
+
+# Run script
+./$file_name
+```
+
+""")
+
+_README_CONFIG_SECTION = """## Configuration
+
+This file contains configuration settings for the application.
+
+"""
+
+_README_FOOTER_TEMPLATE = Template("""## File Analysis
+
+- **File Size:** $file_size bytes
+- **File Type:** $file_type
+- **Last Modified:** $last_modified
+
+## Audit Information
+
+This documentation was automatically generated by the File Audit System when the file was $change_type_lower.
+
+---
+*Generated on $timestamp by File Audit Logger*
+""")
+
+
+def new_hasher():
+    """Return a fresh hash object for the best available algorithm."""
+    if HASH_ALGO == "blake3":
+        return blake3.blake3()
+    if HASH_ALGO == "xxh3_128":
+        return xxhash.xxh3_128()
+    return hashlib.md5()
+
+
+class FilterSet(set):
+    """A set that calls on_change after every in-place modification."""
+    
+    def __init__(self, items=(), on_change=None):
+        super().__init__(items)
+        self.on_change = on_change
+
+
+def _notify_after(name):
+    method = getattr(set, name)
+    
+    def wrapper(self, *args):
+        result = method(self, *args)
+        if self.on_change is not None:
+            self.on_change()
+        return result
+    
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('add', 'discard', 'remove', 'pop', 'clear', 'update', 'difference_update',
+              'intersection_update', 'symmetric_difference_update',
+              '__ior__', '__iand__', '__isub__', '__ixor__'):
+    setattr(FilterSet, _name, _notify_after(_name))
+del _name
+
 
 class DocumentationGenerator:
     """
@@ -33,6 +191,17 @@ class DocumentationGenerator:
         """
         self.readme_dir = Path(readme_dir)
         self.readme_dir.mkdir(exist_ok=True)
+        
+        # Extension -> analyzer; anything else goes to _analyze_generic_file
+        self._analyzers = {
+            '.py': self._analyze_python_file,
+            '.sh': self._analyze_shell_script,
+            '.bash': self._analyze_shell_script,
+            '.json': self._analyze_config_file,
+            '.yaml': self._analyze_config_file,
+            '.yml': self._analyze_config_file,
+            '.md': self._analyze_markdown_file,
+        }
     
     def get_file_analysis(self, file_path: Path) -> Dict[str, str]:
         """
@@ -44,28 +213,34 @@ class DocumentationGenerator:
         Returns:
             Dictionary with file analysis information
         """
+        suffix = file_path.suffix.lower()
         analysis = {
-            'file_type': file_path.suffix.lower(),
+            'file_type': suffix,
             'file_name': file_path.name,
             'relative_path': str(file_path),
             'purpose': 'Unknown',
             'functions': [],
             'classes': [],
             'imports': [],
-            'description': ''
+            'description': '',
+            'file_size': 'Unknown',
+            'last_modified': 'Unknown'
         }
         
+        # Stat once and reuse the result for every size/mtime lookup
+        try:
+            file_stat = file_path.stat()
+            analysis['file_size'] = file_stat.st_size
+            analysis['last_modified'] = datetime.datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+        except OSError:
+            file_stat = None
+        
         try:
-            if file_path.suffix.lower() == '.py':
-                analysis.update(self._analyze_python_file(file_path))
-            elif file_path.suffix.lower() in ['.sh', '.bash']:
-                analysis.update(self._analyze_shell_script(file_path))
-            elif file_path.suffix.lower() in ['.json', '.yaml', '.yml']:
-                analysis.update(self._analyze_config_file(file_path))
-            elif file_path.suffix.lower() == '.md':
-                analysis.update(self._analyze_markdown_file(file_path))
+            analyzer = self._analyzers.get(suffix)
+            if analyzer is not None:
+                analysis.update(analyzer(file_path))
             else:
-                analysis.update(self._analyze_generic_file(file_path))
+                analysis.update(self._analyze_generic_file(file_path, file_stat))
         except Exception as e:
             analysis['error'] = f"Could not analyze file: {e}"
         
@@ -79,41 +254,25 @@ class DocumentationGenerator:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            lines = content.split('\n')
+            tree = ast.parse(content, filename=str(file_path))
+            docstring = ast.get_docstring(tree) or ""
+            
             functions = []
             classes = []
             imports = []
-            docstring = ""
-            
-            # Extract module docstring
-            in_docstring = False
-            docstring_lines = []
-            for line in lines[:20]:  # Check first 20 lines for module docstring
-                line = line.strip()
-                if line.startswith('"""') or line.startswith("'''"):
-                    if in_docstring:
-                        break
-                    in_docstring = True
-                    if len(line) > 3:
-                        docstring_lines.append(line[3:])
-                elif in_docstring:
-                    if line.endswith('"""') or line.endswith("'''"):
-                        docstring_lines.append(line[:-3])
-                        break
-                    docstring_lines.append(line)
             
-            docstring = '\n'.join(docstring_lines).strip()
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    functions.append((node.lineno, node.name))
+                elif isinstance(node, ast.ClassDef):
+                    classes.append((node.lineno, node.name))
+                elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                    imports.append((node.lineno, ast.get_source_segment(content, node) or ast.unparse(node)))
             
-            for line in lines:
-                line = line.strip()
-                if line.startswith('def ') and '(' in line:
-                    func_name = line.split('(')[0].replace('def ', '').strip()
-                    functions.append(func_name)
-                elif line.startswith('class ') and ':' in line:
-                    class_name = line.split(':')[0].replace('class ', '').strip()
-                    classes.append(class_name)
-                elif line.startswith('import ') or line.startswith('from '):
-                    imports.append(line)
+            # ast.walk is breadth-first, so restore source order
+            functions = [name for _, name in sorted(functions)]
+            classes = [name for _, name in sorted(classes)]
+            imports = [stmt for _, stmt in sorted(imports)]
             
             analysis.update({
                 'functions': functions,
@@ -132,16 +291,13 @@ class DocumentationGenerator:
         analysis = {'purpose': 'Shell script'}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            # Look for comments at the top
+            # Look for comments at the top - only the header lines are read
             description_lines = []
-            for line in lines[:10]:
-                if line.strip().startswith('#') and not line.strip().startswith('#!/'):
-                    description_lines.append(line.strip()[1:].strip())
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in itertools.islice(f, 10):
+                    line = line.strip()
+                    if line.startswith('#') and not line.startswith('#!/'):
+                        description_lines.append(line[1:].strip())
             
             analysis['description'] = '\n'.join(description_lines)
             
@@ -159,7 +315,7 @@ class DocumentationGenerator:
                 content = f.read()
             
             # Count lines and estimate complexity
-            lines = len(content.split('\n'))
+            lines = content.count('\n') + 1
             analysis['description'] = f"Configuration file with {lines} lines"
             
         except Exception as e:
@@ -172,17 +328,14 @@ class DocumentationGenerator:
         analysis = {'purpose': 'Documentation file'}
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
             title = ""
             
-            # Find the first heading
-            for line in lines[:5]:
-                if line.startswith('# '):
-                    title = line[2:].strip()
-                    break
+            # Find the first heading - only the first few lines are read
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in itertools.islice(f, 5):
+                    if line.startswith('# '):
+                        title = line[2:].strip()
+                        break
             
             analysis['description'] = f"Documentation: {title}" if title else "Markdown documentation file"
             
@@ -191,12 +344,13 @@ class DocumentationGenerator:
         
         return analysis
     
-    def _analyze_generic_file(self, file_path: Path) -> Dict[str, any]:
+    def _analyze_generic_file(self, file_path: Path,
+                              file_stat: Optional[os.stat_result] = None) -> Dict[str, any]:
         """Analyze generic file."""
         analysis = {'purpose': f'{file_path.suffix.upper()} file'}
         
         try:
-            file_size = file_path.stat().st_size
+            file_size = (file_stat or file_path.stat()).st_size
             analysis['description'] = f"File of type {file_path.suffix} ({file_size} bytes)"
         except Exception as e:
             analysis['error'] = f"Error analyzing file: {e}"
@@ -216,108 +370,90 @@ class DocumentationGenerator:
             Generated README content as markdown
         """
         timestamp = datetime.datetime.now().isoformat()
+        file_type = analysis['file_type']
+        mapping = {
+            'file_name': analysis['file_name'],
+            'file_type': file_type,
+            'file_type_upper': file_type.upper(),
+            'relative_path': analysis['relative_path'],
+            'timestamp': timestamp,
+            'change_type': change_type,
+            'change_type_lower': change_type.lower(),
+            'description': analysis.get('description', 'No description available.'),
+            'purpose': analysis.get('purpose', 'Unknown purpose'),
+            'file_size': analysis.get('file_size', 'Unknown'),
+            'last_modified': analysis.get('last_modified', 'Unknown'),
+        }
         
-        content = f"""# {analysis['file_name']}
-
-**File Type:** {analysis['file_type'].upper()}  
-**Path:** `{analysis['relative_path']}`  
-**Last Updated:** {timestamp}  
-**Change Type:** {change_type}
-
-## Overview
-
-{analysis.get('description', 'No description available.')}
-
-## Purpose
-
-{analysis.get('purpose', 'Unknown purpose')}
-
-"""
+        parts = [_README_HEADER_TEMPLATE.substitute(mapping)]
         
         # Add Python-specific sections
-        if analysis['file_type'] == '.py':
+        if file_type == '.py':
             if analysis.get('functions'):
-                content += f"""## Functions
-
-{', '.join(f'`{func}`' for func in analysis['functions'][:10])}
-
-"""
+                parts.append(_README_FUNCTIONS_TEMPLATE.substitute(
+                    functions=', '.join(f'`{func}`' for func in analysis['functions'][:10])))
             
             if analysis.get('classes'):
-                content += f"""## Classes
-
-{', '.join(f'`{cls}`' for cls in analysis['classes'][:10])}
-
-"""
+                parts.append(_README_CLASSES_TEMPLATE.substitute(
+                    classes=', '.join(f'`{cls}`' for cls in analysis['classes'][:10])))
             
             if analysis.get('imports'):
-                content += f"""## Key Imports
-
-```python
-{chr(10).join(analysis['imports'][:5])}
-```
-
-"""
+                parts.append(_README_IMPORTS_TEMPLATE.substitute(
+                    imports='\n'.join(analysis['imports'][:5])))
         
         # Add shell script specific sections
-        elif analysis['file_type'] in ['.sh', '.bash']:
-            content += """## Usage
-
-```bash
-# Make executable
-chmod +x """ + analysis['file_name'] + """
-
-# Run script
-./""" + analysis['file_name'] + """
-```
-
-"""
+        elif file_type in ['.sh', '.bash']:
+            parts.append(_README_SHELL_TEMPLATE.substitute(mapping))
         
         # Add configuration file sections
-        elif analysis['file_type'] in ['.json', '.yaml', '.yml']:
-            content += """## Configuration
-
-This file contains configuration settings for the application.
-
-"""
+        elif file_type in ['.json', '.yaml', '.yml']:
+            parts.append(_README_CONFIG_SECTION)
         
-        content += f"""## File Analysis
-
-- **File Size:** {file_path.stat().st_size if file_path.exists() else 'Unknown'} bytes
-- **File Type:** {analysis['file_type']}
-- **Last Modified:** {datetime.datetime.fromtimestamp(file_path.stat().st_mtime).isoformat() if file_path.exists() else 'Unknown'}
-
-## Audit Information
-
-This documentation was automatically generated by the File Audit System when the file was {change_type.lower()}.
-
----
-*Generated on {timestamp} by File Audit Logger*
-"""
+        parts.append(_README_FOOTER_TEMPLATE.substitute(mapping))
         
-        return content
+        return ''.join(parts)
+    
+    def get_readme_path(self, file_path: Path) -> Path:
+        """Return the README path used to document file_path."""
+        return self.readme_dir / f"README_{file_path.name.replace('.', '_')}.md"
     
-    def create_or_update_readme(self, file_path: Path, change_type: str) -> Optional[Path]:
+    def is_readme_current(self, readme_path: Path, file_hash: str) -> bool:
+        """Check whether readme_path was generated from a file with file_hash."""
+        try:
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                return f.readline() == AUDIT_HASH_MARKER.format(file_hash)
+        except OSError:
+            return False
+    
+    def create_or_update_readme(self, file_path: Path, change_type: str,
+                                file_hash: Optional[str] = None) -> Optional[Path]:
         """
         Create or update README file for a changed file.
         
         Args:
             file_path: Path to the changed file
             change_type: Type of change (NEW, MODIFIED, etc.)
+            file_hash: Content hash of the file; when given, it is recorded in
+                the README and an existing README with the same hash is kept
             
         Returns:
             Path to the created/updated README file
         """
         try:
             # Generate README filename based on original file
-            readme_name = f"README_{file_path.name.replace('.', '_')}.md"
-            readme_path = self.readme_dir / readme_name
+            readme_path = self.get_readme_path(file_path)
+            
+            # Nothing to do if the README was already generated from this content
+            if file_hash and self.is_readme_current(readme_path, file_hash):
+                return readme_path
             
             # Analyze the file
             analysis = self.get_file_analysis(file_path)
             
             # Generate content
             content = self.generate_readme_content(file_path, analysis, change_type)
+            if file_hash:
+                content = AUDIT_HASH_MARKER.format(file_hash) + content
             
             # Write README file
             with open(readme_path, 'w', encoding='utf-8') as f:
@@ -332,14 +468,15 @@ This documentation was automatically generated by the File Audit System when the
 
 class FileAuditLogger:
     """
-    A comprehensive file audit logging system that tracks file changes using MD5 hashes.
+    A comprehensive file audit logging system that tracks file changes using content hashes.
     """
     
     def __init__(self, 
                  root_dir: str = ".", 
                  audit_log_file: str = "file_audit.log",
                  state_file: str = "file_audit_state.json",
-                 auto_document: bool = True):
+                 auto_document: bool = True,
+                 max_workers: Optional[int] = None):
         """
         Initialize the FileAuditLogger.
         
@@ -348,55 +485,163 @@ class FileAuditLogger:
             audit_log_file: Path to the audit log file
             state_file: Path to store current state for change detection
             auto_document: Whether to automatically generate documentation for changes
+            max_workers: Number of threads used for hashing (default: min(32, cpu_count * 4))
         """
         self.root_dir = Path(root_dir).resolve()
         self.audit_log_file = Path(audit_log_file)
         self.state_file = Path(state_file)
         self.auto_document = auto_document
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        
+        # (size, mtime_ns) per file, used to skip re-hashing unchanged files
+        self._previous_meta: Dict[str, List[int]] = {}
+        self._current_meta: Dict[str, List[int]] = {}
         
         # Initialize documentation generator
         if auto_document:
             self.doc_generator = DocumentationGenerator()
         
-        # Directories and files to exclude from scanning
-        self.excluded_dirs = {
+        # Directories and files to exclude from scanning. These stay ordinary
+        # mutable sets; any change to them recompiles the filters below.
+        self._excluded_dirs_set = FilterSet({
             '__pycache__', '.git', '.ipynb_checkpoints', 
             'node_modules', '.vscode', '.idea', 'venv', 
             'env', '.env', 'logs'
-        }
+        }, self._rebuild_filters)
         
-        self.excluded_files = {
+        self._excluded_files_set = FilterSet({
             '.DS_Store', 'Thumbs.db', '*.pyc', '*.pyo',
             '*.log', '*.tmp', '*.swp', '*.bak'
-        }
+        }, self._rebuild_filters)
         
         # File extensions to include (if None, include all)
-        self.included_extensions = {
+        self._included_extensions_set = FilterSet({
             '.py', '.js', '.ts', '.html', '.css', '.json', 
             '.yaml', '.yml', '.md', '.txt', '.sh', '.sql',
             '.ipynb', '.csv', '.xml', '.ini', '.cfg', '.conf'
-        }
+        }, self._rebuild_filters)
+        
+        self._rebuild_filters()
+    
+    @property
+    def excluded_dirs(self) -> Set[str]:
+        return self._excluded_dirs_set
+    
+    @excluded_dirs.setter
+    def excluded_dirs(self, names) -> None:
+        self._excluded_dirs_set = FilterSet(names or (), self._rebuild_filters)
+        self._rebuild_filters()
     
-    def calculate_md5(self, file_path: Path) -> str:
+    @property
+    def excluded_files(self) -> Set[str]:
+        return self._excluded_files_set
+    
+    @excluded_files.setter
+    def excluded_files(self, patterns) -> None:
+        self._excluded_files_set = FilterSet(patterns or (), self._rebuild_filters)
+        self._rebuild_filters()
+    
+    @property
+    def included_extensions(self) -> Optional[Set[str]]:
+        return self._included_extensions_set
+    
+    @included_extensions.setter
+    def included_extensions(self, extensions) -> None:
+        self._included_extensions_set = (None if extensions is None
+                                         else FilterSet(extensions, self._rebuild_filters))
+        self._rebuild_filters()
+    
+    def _rebuild_filters(self) -> None:
+        """Precompile the exclusion/extension filters; called whenever a filter set changes."""
+        # excluded_files may hold glob patterns like '*.pyc'; '(?!)' never matches
+        self._exclude_re = re.compile(
+            '|'.join(fnmatch.translate(p) for p in self._excluded_files_set) or '(?!)')
+        self._included_exts = frozenset(self._included_extensions_set or ())
+        self._excluded_dirs = frozenset(self._excluded_dirs_set)
+    
+    def calculate_hash(self, file_path: Union[str, Path], dir_fd: Optional[int] = None) -> str:
         """
-        Calculate MD5 hash of a file.
+        Calculate the content hash of a file using HASH_ALGO.
         
         Args:
             file_path: Path to the file
+            dir_fd: Optional directory file descriptor that file_path is relative to
             
         Returns:
-            MD5 hash as hexadecimal string
+            Hash as hexadecimal string
         """
-        hash_md5 = hashlib.md5()
+        hash_obj = new_hasher()
+        opener = None
+        if dir_fd is not None:
+            opener = lambda path, flags: os.open(path, flags, dir_fd=dir_fd)
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            with open(file_path, "rb", opener=opener) as f:
+                if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                    # Large files: hand the whole mapping to the hasher in one call
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hash_obj.update(mm)
+                elif HAS_FILE_DIGEST:
+                    # Python 3.11+: read loop runs in C with a reusable buffer
+                    hash_obj = hashlib.file_digest(f, new_hasher)
+                else:
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                        hash_obj.update(chunk)
+            return hash_obj.hexdigest()
         except (IOError, OSError) as e:
             print(f"Warning: Could not read {file_path}: {e}")
             return "ERROR_READING_FILE"
     
+    def calculate_md5(self, file_path: Union[str, Path]) -> str:
+        """
+        Deprecated alias of calculate_hash.
+        
+        Despite the name, the digest is computed with HASH_ALGO, so it matches
+        the hashes stored in the state file and audit log.
+        """
+        warnings.warn("calculate_md5 is deprecated; use calculate_hash",
+                      DeprecationWarning, stacklevel=2)
+        return self.calculate_hash(file_path)
+    
+    def calculate_hashes(self, file_paths: List[Union[str, Path]]) -> List[str]:
+        """
+        Calculate content hashes for a batch of files.
+        
+        Args:
+            file_paths: Paths to hash
+            
+        Returns:
+            Hashes in the same order as file_paths
+        """
+        return [self.calculate_hash(file_path) for file_path in file_paths]
+    
+    def calculate_hashes_in_dir(self, directory: str, names: List[str]) -> List[str]:
+        """
+        Calculate content hashes for a batch of files in one directory.
+        
+        The directory is opened once and each file is opened relative to it
+        (openat), so the kernel doesn't resolve the full path per file.
+        
+        Args:
+            directory: Directory containing the files
+            names: File names within directory
+            
+        Returns:
+            Hashes in the same order as names
+        """
+        if SUPPORTS_DIR_FD:
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+            except OSError:
+                dir_fd = None
+            
+            if dir_fd is not None:
+                try:
+                    return [self.calculate_hash(name, dir_fd) for name in names]
+                finally:
+                    os.close(dir_fd)
+        
+        return self.calculate_hashes([os.path.join(directory, name) for name in names])
+    
     def should_include_file(self, file_path: Path) -> bool:
         """
         Determine if a file should be included in the audit.
@@ -407,51 +652,166 @@ class FileAuditLogger:
         Returns:
             True if file should be included
         """
-        # Check if file is in excluded files
-        if file_path.name in self.excluded_files:
+        return self._should_include_name(file_path.name)
+    
+    def _should_include_name(self, name: str) -> bool:
+        """should_include_file on a bare file name, without building a Path."""
+        # Check if file matches an excluded name or pattern
+        if self._exclude_re.match(name):
             return False
         
-        # Check file extension
-        if self.included_extensions:
-            return file_path.suffix.lower() in self.included_extensions
+        # Check file extension (same rules as Path.suffix)
+        if self._included_exts:
+            dot = name.rfind('.')
+            return dot > 0 and name[dot:].lower() in self._included_exts
         
         # Include all files if no extension filter is set
         return True
     
-    def scan_directory(self) -> Dict[str, str]:
+    def iter_files(self):
+        """
+        Walk the root directory with os.scandir, pruning excluded directories.
+        
+        Relative paths are built by string concatenation from a per-directory
+        prefix rather than through Path objects.
+        
+        Yields:
+            Tuples of (relative_path, os.DirEntry) for every regular file
+        """
+        stack = [(str(self.root_dir), "")]
+        
+        while stack:
+            directory, rel_prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self._excluded_dirs:
+                                stack.append((entry.path, rel_prefix + entry.name + "/"))
+                        elif entry.is_file():
+                            yield rel_prefix + entry.name, entry
+            except OSError as e:
+                print(f"Warning: Could not scan {directory}: {e}")
+    
+    def scan_directory_quick(self) -> Dict[str, List[int]]:
         """
-        Scan directory and calculate MD5 hashes for all relevant files.
+        Scan directory metadata only, without reading any file contents.
+        
+        A size or mtime that differs from the previous state is enough to
+        know a file changed, so callers that only need "changed?" can stop
+        here.
         
         Returns:
-            Dictionary mapping relative file paths to MD5 hashes
+            Dictionary mapping relative file paths to [size, mtime_ns]
         """
-        file_hashes = {}
+        file_meta = {}
         
-        for root, dirs, files in os.walk(self.root_dir):
-            # Remove excluded directories from the search
-            dirs[:] = [d for d in dirs if d not in self.excluded_dirs]
+        for rel_path, entry in self.iter_files():
+            # Skip if file should not be included
+            if not self._should_include_name(entry.name):
+                continue
             
-            for file in files:
-                file_path = Path(root) / file
-                
-                # Skip if file should not be included
-                if not self.should_include_file(file_path):
-                    continue
-                
-                # Calculate relative path from root directory
-                try:
-                    rel_path = file_path.relative_to(self.root_dir)
-                    md5_hash = self.calculate_md5(file_path)
-                    file_hashes[str(rel_path)] = md5_hash
-                except ValueError:
-                    # Skip if file is outside root directory
-                    continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            file_meta[rel_path] = [stat.st_size, stat.st_mtime_ns]
+        
+        return file_meta
+    
+    def scan_directory(self, previous_hashes: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Scan directory and calculate content hashes for all relevant files.
+        
+        Only files whose size or mtime differ from the previous state are
+        read; the rest reuse the stored hash.
+        
+        Args:
+            previous_hashes: Hashes from the previous state (see load_previous_state)
+        
+        Returns:
+            Dictionary mapping relative file paths to content hashes
+        """
+        previous_hashes = previous_hashes or {}
+        file_hashes = {}
+        to_hash = {}
+        root = str(self.root_dir)
+        
+        # Files needing a hash, grouped by directory as {rel_dir: [name, ...]}
+        file_meta = self.scan_directory_quick()
+        for rel_path, meta in file_meta.items():
+            if rel_path in previous_hashes and self._previous_meta.get(rel_path) == meta:
+                file_hashes[rel_path] = previous_hashes[rel_path]
+            else:
+                rel_dir, _, name = rel_path.rpartition('/')
+                to_hash.setdefault(rel_dir, []).append(name)
+        
+        # Hash files in parallel - reads release the GIL, so threads overlap I/O.
+        # Each task is a batch of files from one directory, so small files don't
+        # pay a future each and the directory is only resolved once per batch.
+        batches = []
+        for rel_dir, names in to_hash.items():
+            for i in range(0, len(names), HASH_BATCH_SIZE):
+                batches.append((rel_dir, names[i:i + HASH_BATCH_SIZE]))
         
+        if batches:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(
+                    self.calculate_hashes_in_dir,
+                    [os.path.join(root, rel_dir) for rel_dir, _ in batches],
+                    [names for _, names in batches])
+                for (rel_dir, names), hashes in zip(batches, results):
+                    prefix = rel_dir + '/' if rel_dir else ''
+                    for name, file_hash in zip(names, hashes):
+                        file_hashes[prefix + name] = file_hash
+        
+        self._current_meta = file_meta
         return file_hashes
     
+    def _read_state_tsv(self) -> Dict:
+        """Stream a line-delimited state file into the same shape as the JSON state."""
+        file_hashes = {}
+        file_meta = {}
+        
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            header = f.readline()
+            if not header.startswith(TSV_STATE_HEADER):
+                raise ValueError(f"Unrecognised state file header: {header.strip()!r}")
+            hash_algo = header[len(TSV_STATE_HEADER):].strip()
+            
+            for line in f:
+                # Split from the right: only the path may itself contain tabs
+                path, size, mtime_ns, file_hash = line.rstrip('\n').rsplit('\t', 3)
+                file_hashes[path] = file_hash
+                if size:
+                    file_meta[path] = [int(size), int(mtime_ns)]
+        
+        return {'hash_algo': hash_algo, 'file_hashes': file_hashes, 'file_meta': file_meta}
+    
+    def _write_state_tsv(self, state: Dict) -> None:
+        """Write state as one 'path<TAB>size<TAB>mtime_ns<TAB>hash' line per file."""
+        file_meta = state['file_meta']
+        
+        def lines():
+            yield f"{TSV_STATE_HEADER}{state['hash_algo']}\n"
+            for path, file_hash in sorted(state['file_hashes'].items()):
+                size, mtime_ns = file_meta.get(path, ('', ''))
+                yield f"{path}\t{size}\t{mtime_ns}\t{file_hash}\n"
+        
+        with open(self.state_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(lines())
+    
     def load_previous_state(self) -> Dict[str, str]:
         """
-        Load previous file state from JSON file.
+        Load previous file state from the state file.
+        
+        State files ending in .tsv use a line-delimited format that is
+        streamed rather than parsed as one JSON document; anything else is
+        read as JSON.
+        
+        State written with a different hash algorithm can't be compared
+        against the current scan, so it is discarded and the audit starts
+        from a fresh baseline.
         
         Returns:
             Dictionary of previous file hashes, empty if file doesn't exist
@@ -460,22 +820,51 @@ class FileAuditLogger:
             return {}
         
         try:
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            if self.state_file.suffix == '.tsv':
+                state = self._read_state_tsv()
+            elif orjson is not None:
+                state = orjson.loads(self.state_file.read_bytes())
+            else:
+                with open(self.state_file, 'r') as f:
+                    state = json.load(f)
+        except (ValueError, IOError) as e:
             print(f"Warning: Could not load previous state: {e}")
             return {}
+        
+        # Legacy state files are a flat {path: md5} mapping
+        if 'file_hashes' not in state:
+            state = {'hash_algo': 'md5', 'file_hashes': state}
+        
+        if state.get('hash_algo') != HASH_ALGO:
+            print(f"Warning: Previous state uses {state.get('hash_algo')} hashes, "
+                  f"now using {HASH_ALGO} - starting a new baseline")
+            return {}
+        
+        self._previous_meta = state.get('file_meta', {})
+        return state['file_hashes']
     
     def save_current_state(self, file_hashes: Dict[str, str]) -> None:
         """
-        Save current file state to JSON file.
+        Save current file state to the state file (TSV or JSON, see load_previous_state).
         
         Args:
-            file_hashes: Dictionary mapping file paths to MD5 hashes
+            file_hashes: Dictionary mapping file paths to content hashes
         """
+        state = {
+            'hash_algo': HASH_ALGO,
+            'file_hashes': file_hashes,
+            'file_meta': self._current_meta
+        }
+        
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(file_hashes, f, indent=2, sort_keys=True)
+            if self.state_file.suffix == '.tsv':
+                self._write_state_tsv(state)
+            elif orjson is not None:
+                self.state_file.write_bytes(
+                    orjson.dumps(state, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2))
+            else:
+                with open(self.state_file, 'w') as f:
+                    json.dump(state, f, indent=2, sort_keys=True)
         except IOError as e:
             print(f"Warning: Could not save current state: {e}")
     
@@ -491,28 +880,34 @@ class FileAuditLogger:
         Returns:
             Tuple of (new_files, modified_files, deleted_files)
         """
-        current_files = set(current_hashes.keys())
-        previous_files = set(previous_hashes.keys())
-        
-        new_files = current_files - previous_files
-        deleted_files = previous_files - current_files
+        # dict key views support set operations directly, without copying into sets
+        new_files = current_hashes.keys() - previous_hashes.keys()
+        deleted_files = previous_hashes.keys() - current_hashes.keys()
         
-        # Find modified files (files that exist in both but have different hashes)
-        common_files = current_files & previous_files
+        # Find modified files (files that exist in both but have different hashes),
+        # walking the smaller dict with a single lookup into the larger one
+        smaller, larger = ((previous_hashes, current_hashes)
+                           if len(previous_hashes) < len(current_hashes)
+                           else (current_hashes, previous_hashes))
         modified_files = {
-            file for file in common_files 
-            if current_hashes[file] != previous_hashes[file]
+            file for file, file_hash in smaller.items()
+            if (other := larger.get(file)) is not None and other != file_hash
         }
         
         return new_files, modified_files, deleted_files
     
-    def generate_documentation(self, changed_files: Set[str], change_type: str) -> List[Path]:
+    def generate_documentation(self, changed_files: Set[str], change_type: str,
+                               file_hashes: Optional[Dict[str, str]] = None) -> List[Path]:
         """
         Generate documentation for changed files.
         
+        READMEs are generated concurrently, and a README already generated
+        from the file's current hash is left untouched.
+        
         Args:
             changed_files: Set of file paths that changed
             change_type: Type of change (NEW, MODIFIED)
+            file_hashes: Optional current file hashes, used to skip up-to-date READMEs
             
         Returns:
             List of created README file paths
@@ -522,7 +917,13 @@ class FileAuditLogger:
         if not self.auto_document:
             return created_readmes
         
-        for file_path_str in changed_files:
+        file_hashes = file_hashes or {}
+        messages = []
+        
+        # One job per README - files sharing a name map to the same README, so
+        # only the last one is kept rather than racing two writers
+        jobs = {}
+        for file_path_str in sorted(changed_files):
             file_path = self.root_dir / file_path_str
             
             # Skip readme files themselves to avoid recursion
@@ -533,13 +934,25 @@ class FileAuditLogger:
             if file_path.suffix.lower() in ['.log', '.json', '.csv']:
                 continue
             
-            try:
-                readme_path = self.doc_generator.create_or_update_readme(file_path, change_type)
-                if readme_path:
-                    created_readmes.append(readme_path)
-                    print(f"  📝 Generated documentation: {readme_path}")
-            except Exception as e:
-                print(f"  ❌ Failed to generate docs for {file_path}: {e}")
+            jobs[self.doc_generator.get_readme_path(file_path)] = (file_path, file_hashes.get(file_path_str))
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.doc_generator.create_or_update_readme, file_path, change_type, file_hash): file_path
+                for file_path, file_hash in jobs.values()
+            }
+            for future, file_path in futures.items():
+                try:
+                    readme_path = future.result()
+                    if readme_path:
+                        created_readmes.append(readme_path)
+                        messages.append(f"  📝 Generated documentation: {readme_path}")
+                except Exception as e:
+                    messages.append(f"  ❌ Failed to generate docs for {file_path}: {e}")
+        
+        # Emit all per-file messages in one write rather than a print per file
+        if messages:
+            sys.stdout.write('\n'.join(messages) + '\n')
         
         return created_readmes
     
@@ -549,40 +962,44 @@ class FileAuditLogger:
         Write audit log entries for files.
         
         Args:
-            file_hashes: Dictionary mapping file paths to MD5 hashes
+            file_hashes: Dictionary mapping file paths to content hashes
             changes: Optional tuple of (new_files, modified_files, deleted_files)
         """
         timestamp = datetime.datetime.now().isoformat()
         
-        # Create audit log file if it doesn't exist
+        # Assemble every entry first, then append them with a single write
+        lines = []
+        
+        # Start with a header if the audit log doesn't exist yet
         if not self.audit_log_file.exists():
-            with open(self.audit_log_file, 'w') as f:
-                f.write("# File Audit Log\n")
-                f.write("# Format: TIMESTAMP | FILE_PATH | MD5_HASH | STATUS\n")
-                f.write("# Status: NEW, MODIFIED, UNCHANGED, DELETED\n\n")
-        
-        with open(self.audit_log_file, 'a') as f:
-            if changes:
-                new_files, modified_files, deleted_files = changes
-                
-                # Log deleted files
-                for file_path in deleted_files:
-                    f.write(f"{timestamp} | {file_path} | DELETED | DELETED\n")
+            lines.append("# File Audit Log\n")
+            lines.append("# Format: TIMESTAMP | FILE_PATH | HASH | STATUS\n")
+            lines.append("# Status: NEW, MODIFIED, UNCHANGED, DELETED\n\n")
+        
+        if changes:
+            new_files, modified_files, deleted_files = changes
+            
+            # Log deleted files
+            for file_path in deleted_files:
+                lines.append(f"{timestamp} | {file_path} | DELETED | DELETED\n")
+            
+            # Log all current files with their status
+            for file_path, file_hash in sorted(file_hashes.items()):
+                if file_path in new_files:
+                    status = "NEW"
+                elif file_path in modified_files:
+                    status = "MODIFIED"
+                else:
+                    status = "UNCHANGED"
                 
-                # Log all current files with their status
-                for file_path, md5_hash in sorted(file_hashes.items()):
-                    if file_path in new_files:
-                        status = "NEW"
-                    elif file_path in modified_files:
-                        status = "MODIFIED"
-                    else:
-                        status = "UNCHANGED"
-                    
-                    f.write(f"{timestamp} | {file_path} | {md5_hash} | {status}\n")
-            else:
-                # Initial scan - log all files as NEW
-                for file_path, md5_hash in sorted(file_hashes.items()):
-                    f.write(f"{timestamp} | {file_path} | {md5_hash} | INITIAL\n")
+                lines.append(f"{timestamp} | {file_path} | {file_hash} | {status}\n")
+        else:
+            # Initial scan - log all files as NEW
+            for file_path, file_hash in sorted(file_hashes.items()):
+                lines.append(f"{timestamp} | {file_path} | {file_hash} | INITIAL\n")
+        
+        with open(self.audit_log_file, 'a', buffering=1 << 20) as f:
+            f.write(''.join(lines))
     
     def run_audit(self, verbose: bool = True) -> Dict[str, str]:
         """
@@ -597,15 +1014,15 @@ class FileAuditLogger:
         if verbose:
             print(f"Starting file audit scan in: {self.root_dir}")
         
-        # Scan current directory
-        current_hashes = self.scan_directory()
+        # Load previous state
+        previous_hashes = self.load_previous_state()
+        
+        # Scan current directory, reusing hashes of files that haven't changed
+        current_hashes = self.scan_directory(previous_hashes)
         
         if verbose:
             print(f"Scanned {len(current_hashes)} files")
         
-        # Load previous state
-        previous_hashes = self.load_previous_state()
-        
         # Detect changes if we have previous state
         if previous_hashes:
             changes = self.detect_changes(current_hashes, previous_hashes)
@@ -631,11 +1048,11 @@ class FileAuditLogger:
                 
                 # Generate docs for new files
                 if new_files:
-                    self.generate_documentation(new_files, "NEW")
+                    self.generate_documentation(new_files, "NEW", current_hashes)
                 
                 # Generate docs for modified files
                 if modified_files:
-                    self.generate_documentation(modified_files, "MODIFIED")
+                    self.generate_documentation(modified_files, "MODIFIED", current_hashes)
             
             # Write audit log with changes
             self.write_audit_log(current_hashes, changes)
@@ -661,14 +1078,16 @@ class FileAuditLogger:
             file_path: Relative path to the file
             
         Returns:
-            Dictionary with file information or None if not found
+            Dictionary with file information or None if not found. The
+            content hash is under 'hash', computed with 'hash_algo'.
         """
-        current_hashes = self.scan_directory()
+        current_hashes = self.scan_directory(self.load_previous_state())
         
         if file_path in current_hashes:
             return {
                 'path': file_path,
-                'md5_hash': current_hashes[file_path],
+                'hash': current_hashes[file_path],
+                'hash_algo': HASH_ALGO,
                 'exists': True,
                 'last_scanned': datetime.datetime.now().isoformat()
             }
@@ -678,7 +1097,7 @@ class FileAuditLogger:
 
 def main():
     """Main function for command-line usage."""
-    parser = argparse.ArgumentParser(description='File Audit Logger - Track file changes with MD5 hashes')
+    parser = argparse.ArgumentParser(description='File Audit Logger - Track file changes with content hashes')
     parser.add_argument('--dir', '-d', default='.', help='Directory to scan (default: current directory)')
     parser.add_argument('--log-file', '-l', default='file_audit.log', help='Audit log file path')
     parser.add_argument('--state-file', '-s', default='file_audit_state.json', help='State file path')
@@ -701,7 +1120,7 @@ def main():
         status = logger.get_file_status(args.check_file)
         if status:
             print(f"File: {status['path']}")
-            print(f"MD5 Hash: {status['md5_hash']}")
+            print(f"Hash ({status['hash_algo']}): {status['hash']}")
             print(f"Last Scanned: {status['last_scanned']}")
         else:
             print(f"File not found: {args.check_file}")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for file_audit_logger.py
+==============================
+
+Covers the file filters, state persistence and incremental hashing of
+FileAuditLogger.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from file_audit_logger import HASH_ALGO, FileAuditLogger
+
+
+def make_logger(root: Path, state_name: str = "state.json") -> FileAuditLogger:
+    """FileAuditLogger over root, keeping its log/state files outside the scanned tree"""
+    work = root.parent / "audit"
+    work.mkdir(exist_ok=True)
+    return FileAuditLogger(root_dir=str(root),
+                           audit_log_file=str(work / "audit.log"),
+                           state_file=str(work / state_name),
+                           auto_document=False)
+
+
+def test_exclusion_filters_follow_later_changes(tmp_path):
+    """Filters changed after __init__ are honoured"""
+    logger = make_logger(tmp_path)
+    compiled = logger._exclude_re
+    assert logger.should_include_file(Path("notes.txt"))
+    assert not logger.should_include_file(Path("module.pyc"))
+    assert logger._exclude_re is compiled  # Lookups never recompile
+
+    logger.excluded_files.add("notes.txt")
+    logger.included_extensions.add(".dat")
+    assert not logger.should_include_file(Path("notes.txt"))
+    assert logger.should_include_file(Path("data.dat"))
+
+    (tmp_path / "skip").mkdir()
+    (tmp_path / "skip" / "a.py").write_text("x = 1\n")
+    (tmp_path / "keep.py").write_text("y = 2\n")
+    logger.excluded_dirs.add("skip")
+    assert set(logger.scan_directory_quick()) == {"keep.py"}
+
+    logger.excluded_dirs = set()  # Reassignment is picked up too
+    assert set(logger.scan_directory_quick()) == {"keep.py", "skip/a.py"}
+
+
+def test_empty_excluded_files_excludes_nothing(tmp_path):
+    """An empty exclusion set must not match every name"""
+    logger = make_logger(tmp_path)
+    logger.excluded_files.clear()
+    assert logger.should_include_file(Path("module.py"))
+    assert logger.should_include_file(Path("build.log")) is False  # Not an included extension
+
+    logger.included_extensions = None
+    assert logger.should_include_file(Path("build.log"))
+
+
+def test_tsv_state_round_trip(tmp_path):
+    """A .tsv state file reloads the same hashes and metadata, including paths with tabs"""
+    root = tmp_path / "tree"
+    root.mkdir()
+    (root / "plain.py").write_text("a = 1\n")
+    (root / "tab\tname.py").write_text("b = 2\n")
+
+    logger = make_logger(root, "state.tsv")
+    hashes = logger.scan_directory()
+    logger.save_current_state(hashes)
+
+    reloaded = make_logger(root, "state.tsv")
+    assert reloaded.load_previous_state() == hashes
+    assert reloaded._previous_meta == logger._current_meta
+    assert set(hashes) == {"plain.py", "tab\tname.py"}
+
+
+def test_unchanged_size_and_mtime_reuse_stored_hash(tmp_path):
+    """Files whose size and mtime match the previous state are not re-hashed"""
+    root = tmp_path / "tree"
+    root.mkdir()
+    target = root / "data.txt"
+    target.write_text("aaaa\n")
+    stat = target.stat()
+
+    logger = make_logger(root)
+    first = logger.scan_directory(logger.load_previous_state())
+    logger.save_current_state(first)
+
+    # Same size and mtime: the stored hash is trusted, so the edit goes unseen
+    target.write_text("bbbb\n")
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    logger = make_logger(root)
+    assert logger.scan_directory(logger.load_previous_state()) == first
+
+    # A new mtime forces a re-hash
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    logger = make_logger(root)
+    second = logger.scan_directory(logger.load_previous_state())
+    assert second["data.txt"] == logger.calculate_hash(target) != first["data.txt"]
+
+
+def test_hash_naming_and_deprecated_md5_alias(tmp_path):
+    """Status reports 'hash' with its algorithm; calculate_md5 only survives as a deprecated alias"""
+    root = tmp_path / "tree"
+    root.mkdir()
+    (root / "a.py").write_text("a = 1\n")
+    logger = make_logger(root)
+
+    status = logger.get_file_status("a.py")
+    assert status["hash"] == logger.calculate_hash(root / "a.py")
+    assert status["hash_algo"] == HASH_ALGO
+    assert "md5_hash" not in status
+
+    with pytest.deprecated_call():
+        assert logger.calculate_md5(root / "a.py") == status["hash"]
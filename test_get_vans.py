@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for get_vans.py
+=====================
+
+Covers the typed listing frames and postcode selection. Skipped when the
+scraper's dependencies (pandas, Playwright) are not installed.
+"""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("playwright")
+
+import get_vans
+
+
+def test_listings_frame_uses_nullable_integer_dtypes():
+    """Missing numeric fields stay <NA> instead of turning the column into floats"""
+    df = get_vans.listings_to_frame([
+        {"title": "Transit", "year": 2019, "mileage": 45_000, "price": 12_500},
+        {"title": "Transit", "year": None, "mileage": None, "price": None},
+    ])
+    for column, dtype in get_vans.LISTING_DTYPES.items():
+        if column in df:
+            assert df[column].dtype == dtype
+    assert df["price"].isna().tolist() == [False, True]
+    assert df["price"].iloc[0] == 12_500
+
+
+def test_listings_without_prices_summarise_and_band():
+    """An all-<NA> nullable column neither breaks the price summary nor the banding"""
+    df = get_vans.listings_to_frame([{"year": 2019, "mileage": None, "price": None}])
+    assert get_vans._price_range_text(df["price"]) == "n/a"
+    assert get_vans._median_price_by_band(df, "mileage", 50_000).empty
+
+    df = get_vans.listings_to_frame([{"year": 2019, "mileage": 60_000, "price": 9_999},
+                                     {"year": 2020, "mileage": 10_000, "price": 14_000}])
+    assert get_vans._price_range_text(df["price"]) == "£9,999 - £14,000"
+    medians = get_vans._median_price_by_band(df, "mileage", 50_000)
+    assert medians.tolist() == [14_000, 9_999]
+
+
+def test_exclude_used_skips_areas_already_handed_out(tmp_path, monkeypatch):
+    """Repeated get_postcodes calls move on to fresh areas unless exclude_used is off"""
+    monkeypatch.chdir(tmp_path)  # PostcodeIntelligence keeps its database under ./data
+    (tmp_path / "data").mkdir()
+    manager = get_vans.PostcodeManager()
+    strategy = get_vans.PostcodeStrategy.COMMERCIAL_HUBS
+
+    def areas(postcodes):
+        return {pc.split()[0] for pc in postcodes}
+
+    first = manager.get_postcodes(strategy=strategy, limit=5)
+    second = manager.get_postcodes(strategy=strategy, limit=5)
+    assert len(first) == len(second) == 5
+    assert not areas(first) & areas(second)
+
+    again = manager.get_postcodes(strategy=strategy, limit=5, exclude_used=False)
+    assert areas(again) & areas(first)
+
+
+def test_card_parser_builds_with_real_vat_detection():
+    """make_card_parser resolves detect_vat_status from the scrapers package and parses a card"""
+    parse_card = get_vans.make_card_parser()
+    row = parse_card({
+        "text": "Ford Transit\n2.0 EcoBlue 130ps L2 H2 Panel Van\n2019 (69 reg)\n45,000 miles\n£12,500\nNo VAT",
+        "titles": ["Ford Transit 2.0 EcoBlue"], "prices": ["£12,500"], "images": [None],
+        "descriptions": [None], "link": "/car-details/1",
+    })
+    assert row is not None
+    assert (row["year"], row["mileage"], row["price"]) == (2019, 45_000, 12_500)
+    assert "vat_included" in row
+
+
+def test_postcode_manager_releases_its_database(tmp_path, monkeypatch):
+    """Managers close their SQLite connection on exit and are not pinned for the process lifetime"""
+    import gc
+    import weakref
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    with get_vans.PostcodeManager() as manager:
+        manager.record_success_rate("M1 1AA", 12)
+    assert manager.intelligence._conn is None
+    manager.close()  # Closing twice is harmless
+
+    with get_vans.PostcodeManager() as reopened:
+        assert "M1" in reopened._success_rates  # The buffered write was flushed on close
+
+    ref = weakref.ref(get_vans.PostcodeManager().intelligence)
+    gc.collect()
+    assert ref() is None
+
+
+def test_strategy_import_replaces_observation_counts(tmp_path, monkeypatch):
+    """Imported rates bring their own observation counts, in memory and in the database"""
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    with get_vans.PostcodeManager() as source:
+        for _ in range(3):
+            source.record_success_rate("M1 1AA", 8)
+        get_vans.StrategySaveLoad.export_strategy(source, "test", "strategy.json")
+
+    legacy = json.loads((tmp_path / "strategy.json").read_bytes())
+    del legacy["success_counts"]
+    (tmp_path / "legacy.json").write_text(json.dumps(legacy))
+
+    with get_vans.PostcodeManager() as manager:
+        manager._success_counts["M1"] = 40  # Stale in-memory count
+        assert get_vans.StrategySaveLoad.import_strategy(manager, "strategy.json")
+        assert manager._success_counts["M1"] == 3
+        assert manager.intelligence.load_success_rates()["M1"] == (manager._success_rates["M1"], 3)
+
+        assert get_vans.StrategySaveLoad.import_strategy(manager, "legacy.json")
+        assert manager._success_counts["M1"] == 1
+        assert manager.intelligence.load_success_rates()["M1"][1] == 1